@@ -18,10 +18,247 @@ Usage:
 import pandas as pd
 import networkx as nx
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
 import numpy as np
 from pathlib import Path
 import json
-from typing import Dict, List, Tuple, Optional
+import hashlib
+import functools
+import copy
+import os
+import tempfile
+from typing import Dict, List, Tuple, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # enables pandas' pyarrow CSV engine and parquet sidecars
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pyarrow = None
+    CSV_ENGINE = 'c'
+
+@functools.lru_cache(maxsize=8)
+def _parse_csv(path: str, mtime_ns: int, columns: Tuple[Tuple[str, object], ...]) -> pd.DataFrame:
+    """
+    Parse a CSV file once per process for each (path, modification time, columns)
+
+    Keying on the modification time means an edited file is parsed again. The
+    cached frame is shared, so callers must not modify it in place.
+
+    With pyarrow installed, the parsed columns are also saved to a .parquet file
+    next to the CSV, which later processes load instead of parsing the CSV for
+    as long as it is newer than the CSV and holds the expected columns and dtypes.
+    """
+    dtypes = dict(columns)
+    parquet = Path(path).with_suffix('.parquet')
+    if pyarrow is not None and parquet.exists() and parquet.stat().st_mtime_ns >= mtime_ns:
+        try:
+            df = pd.read_parquet(parquet)
+        except Exception:
+            df = None  # Unreadable sidecar: parse the CSV and rewrite it
+        if df is not None and _has_dtypes(df, dtypes):
+            return df
+
+    df = pd.read_csv(path, engine=CSV_ENGINE, usecols=list(dtypes), dtype=dtypes)
+    if pyarrow is not None:
+        _write_parquet(df, parquet)
+    return df
+
+
+def _has_dtypes(df: pd.DataFrame, dtypes: Dict[str, object]) -> bool:
+    """True if df has exactly the given columns, in order, with the given dtypes"""
+    if list(df.columns) != list(dtypes):
+        return False
+    for column, dtype in dtypes.items():
+        if dtype is str:
+            if not pd.api.types.is_string_dtype(df[column]):
+                return False
+        elif df[column].dtype != np.dtype(dtype):
+            return False
+    return True
+
+
+def _write_parquet(df: pd.DataFrame, parquet: Path) -> None:
+    """
+    Save df as a parquet sidecar, replacing any existing file atomically
+
+    The file is written under a temporary name first, so other processes never
+    read a half-written sidecar.
+    """
+    try:
+        fd, tmp = tempfile.mkstemp(dir=parquet.parent, prefix=f"{parquet.name}.", suffix='.tmp')
+    except OSError:
+        return  # Read-only data directory: keep parsing the CSV
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            df.to_parquet(f, index=False)
+        os.replace(tmp, parquet)
+    except Exception:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def _read_json(filename: str):
+    """Parse a JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(Path(filename).read_bytes())
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(data, filename: str) -> None:
+    """Write data as 2-space indented JSON, with orjson when it is installed"""
+    if orjson is not None:
+        Path(filename).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def _ccw(ax, ay, bx, by, cx, cy):
+    """
+    True where C lies counter-clockwise of the ray A->B
+
+    Works elementwise on NumPy arrays as well as on scalars.
+    """
+    return (cy-ay) * (bx-ax) > (by-ay) * (cx-ax)
+
+
+def _read_positions_npz(filename) -> Dict[str, Tuple[float, float]]:
+    """Load positions saved by _write_positions_npz"""
+    with np.load(filename) as data:
+        return dict(zip(data['nodes'].tolist(), map(tuple, data['xy'].tolist())))
+
+
+def _write_positions_npz(pos: Dict[str, Tuple[float, float]], filename, dtype=np.float64) -> None:
+    """Save positions as compressed node-name and (N, 2) coordinate arrays"""
+    np.savez_compressed(
+        filename,
+        nodes=np.array(list(pos.keys())),
+        xy=np.array(list(pos.values()), dtype=dtype),
+    )
+
+
+# Above this many edges, edge-crossing counting sweeps over x-extents
+# instead of testing every pair of edges
+SWEEP_EDGE_THRESHOLD = 500
+
+# Fraction of edges drawn at each edge level of detail (0 = every gate)
+EDGE_LOD_FRACTIONS = (1.0, 0.5, 0.25)
+
+# Layout algorithms supported by calculate_layout, with their display names
+LAYOUT_METHODS = {
+    'kamada_kawai': 'Kamada-Kawai',
+    'stress': 'stress majorization',
+}
+
+# Layouts calculated or loaded in this process, keyed by GraphVisualizer._layout_key
+_LAYOUT_MEMO: Dict[str, Dict[str, Tuple[float, float]]] = {}
+
+# Node attributes copied from systems_full.csv onto each graph node, with their types
+NODE_ATTRIBUTES = {
+    'system_id': int,
+    'constellation': str,
+    'constellation_id': int,
+    'security': float,
+    'moons': int,
+    'planets': int,
+    'belts': int,
+    'has_ice': bool,
+    'power_capacity': int,
+    'workforce_capacity': int,
+}
+
+# Columns read from systems_full.csv, with the narrowest dtypes that hold their values
+# (galaxy x/y/z coordinates are not read; layouts come from the gate graph)
+SYSTEM_COLUMNS = {
+    'system_id': 'int32',
+    'system_name': str,
+    'constellation_id': 'int32',
+    'constellation': str,
+    'security': 'float64',
+    'moons': 'int16',
+    'planets': 'int16',
+    'belts': 'int16',
+    'has_ice': 'bool',
+    'power_capacity': 'int32',
+    'workforce_capacity': 'int32',
+}
+
+# Columns read from the gate CSVs
+GATE_COLUMNS = {
+    'from_system': str,
+    'to_system': str,
+}
+
+
+class _Positions(dict):
+    """
+    Position dict that reports every change to its owner
+
+    GraphVisualizer keeps array copies of its positions for trace building and
+    crossing counts; editing viz.pos in place drops those copies.
+    """
+
+    _on_change = None
+
+    def __init__(self, data=(), on_change=None):
+        super().__init__(data)
+        self._on_change = on_change
+
+    def _changed(self):
+        if self._on_change is not None:
+            self._on_change()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        super().update(other)
+        self._changed()
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    # Copies and pickles are plain dicts, detached from the owning visualizer
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
 
 
 class GraphVisualizer:
@@ -29,197 +266,670 @@ class GraphVisualizer:
     Handles graph construction and visualization for Pure Blind region
     """
 
-    def __init__(self, data_dir: str = "data/pure_blind_data"):
+    def __init__(self, data_dir: str = "data/pure_blind_data", layout_cache_dir: Optional[str] = "layouts"):
         """
         Initialize the visualizer with data directory
 
         Args:
             data_dir: Path to directory containing CSV files
+            layout_cache_dir: Directory for cached layouts of either method (None disables
+                              only this on-disk cache; layouts already computed in this
+                              process are still reused)
         """
         self.data_dir = Path(data_dir)
+        self.layout_cache_dir = Path(layout_cache_dir) if layout_cache_dir else None
         self.graph = None
         self.systems_df = None
         self.constellation_colors = {}
         self.pos = {}  # 2D positions for nodes
+        self._node_idx = {}  # system name -> row in self._pos_arr
+        self._pos_arr = None  # (N, 2) float32 copy of self.pos for vectorized trace building
+        self._edges = None  # (E, 2) node rows of each edge, in graph edge order
+        self._edge_xy = None  # (E, 4) float64 x1, y1, x2, y2 of each edge in the current layout
+        self._names = None  # system names in graph node order
+        self._constellation = None  # constellation of each system, in graph node order
+        self._hover = None  # hover HTML of each system in graph node order, formatted once in build_graph
+        self._nodes_by_constellation = {}  # constellation -> system names, built in build_graph
+        self._edges_by_rank = None  # rows of self._edges sorted by endpoint PageRank, for edge level of detail
+        self._dist = {}  # source row -> (N,) int16 jump distances in graph node order, -1 if unreachable
+        self._pred = {}  # source row -> (N,) int32 BFS predecessors: _pred[s][t] is t's parent on a route from s
+        self._csr = None  # (N, N) CSR adjacency matrix in graph node order
+        self._apsp = None  # (N, N) float all-pairs jump distances for layouts, inf if unreachable
+
+    @property
+    def pos(self) -> Dict[str, Tuple[float, float]]:
+        """2D positions for nodes; editing or replacing them refreshes the figures"""
+        return self._pos
+
+    @pos.setter
+    def pos(self, positions: Dict[str, Tuple[float, float]]) -> None:
+        self._pos = _Positions(positions, self._positions_changed)
+        self._positions_changed()
+
+    def _positions_changed(self) -> None:
+        """Drop everything derived from self.pos; rebuilt lazily on next use"""
+        self._pos_arr = None
+        self._edge_xy = None
 
     def load_data(self) -> None:
         """Load all data from CSV files"""
         print("Loading system data...")
-        self.systems_df = pd.read_csv(self.data_dir / "systems_full.csv")
+        self.systems_df = self._read_csv("systems_full.csv", SYSTEM_COLUMNS)
+        self.constellation_colors = {}  # New data may have different constellations
         print(f"Loaded {len(self.systems_df)} systems")
 
         # Load gate connections
         print("Loading gate connections...")
-        gates_internal = pd.read_csv(self.data_dir / "gates_internal.csv")
-        gates_border = pd.read_csv(self.data_dir / "gates_border.csv")
+        gates_internal = self._read_csv("gates_internal.csv", GATE_COLUMNS)
+        gates_border = self._read_csv("gates_border.csv", GATE_COLUMNS)
 
         # Combine all gates
         self.gates_df = pd.concat([gates_internal, gates_border], ignore_index=True)
         print(f"Loaded {len(self.gates_df)} gate connections")
 
-    def build_graph(self) -> nx.Graph:
+    def _read_csv(self, filename: str, columns: Dict[str, object]) -> pd.DataFrame:
+        """
+        Read selected columns of a CSV file from the data directory
+
+        Uses pandas' multithreaded pyarrow parser when pyarrow is installed,
+        otherwise the default C parser. Only the listed columns are parsed, with
+        their dtypes given up front instead of inferred. Parsed files are cached
+        for the life of the process, so later GraphVisualizer instances only
+        copy the frame.
+
+        Args:
+            filename: CSV file name inside the data directory
+            columns: Column name -> dtype mapping of the columns to read
+
+        Returns:
+            DataFrame with the requested columns
+        """
+        path = self.data_dir / filename
+        return _parse_csv(str(path), path.stat().st_mtime_ns, tuple(columns.items())).copy()
+
+    def build_graph(self, verify: bool = False) -> nx.Graph:
         """
         Build NetworkX graph from loaded data
 
+        Args:
+            verify: Check and print whether every system is reachable from every other
+
         Returns:
             NetworkX Graph with all system attributes
         """
         print("Building NetworkX graph...")
         self.graph = nx.Graph()
+        self._edges_by_rank = None
 
         # Create set of system names we have data for
         known_systems = set(self.systems_df['system_name'])
 
-        # Add nodes with attributes
-        for _, system in self.systems_df.iterrows():
-            self.graph.add_node(
-                system['system_name'],
-                system_id=int(system['system_id']),
-                constellation=system['constellation'],
-                constellation_id=int(system['constellation_id']),
-                security=float(system['security']),
-                moons=int(system['moons']),
-                planets=int(system['planets']),
-                belts=int(system['belts']),
-                has_ice=bool(system['has_ice']),
-                power_capacity=int(system['power_capacity']),
-                workforce_capacity=int(system['workforce_capacity']),
-            )
+        # Add nodes with attributes, cast once per column instead of once per row
+        nodes = self.systems_df.astype(NODE_ATTRIBUTES)
+        self.graph.add_nodes_from(zip(
+            nodes['system_name'],
+            nodes[list(NODE_ATTRIBUTES)].to_dict(orient='records'),
+        ))
+
+        # Constellation -> systems index, so grouping never rescans every node
+        self._nodes_by_constellation = {}
+        for node, attrs in self.graph.nodes(data=True):
+            self._nodes_by_constellation.setdefault(attrs['constellation'], []).append(node)
+
+        # Per-system columns in graph node order (the same row order as _pos_arr),
+        # so figures slice arrays instead of looking up attributes node by node
+        self._names = nodes['system_name'].to_numpy()
+        self._constellation = nodes['constellation'].to_numpy()
+
+        # Hover text only depends on the system data, so format it once for all figures
+        self._hover = (
+            '<b>' + nodes['system_name'] + '</b><br>' +
+            'Constellation: ' + nodes['constellation'] + '<br>' +
+            'Security: ' + nodes['security'].map('{:.2f}'.format) + '<br>' +
+            'Moons: ' + nodes['moons'].astype(str) + '<br>' +
+            'Ice: ' + nodes['has_ice'].map({True: 'Yes', False: 'No'}) + '<br>' +
+            'Power: ' + nodes['power_capacity'].astype(str) + '<br>' +
+            'Workforce: ' + nodes['workforce_capacity'].astype(str)
+        ).to_numpy()
 
         # Add edges from gate connections (only internal Pure Blind connections)
-        internal_edges = 0
-        border_edges = 0
-        for _, gate in self.gates_df.iterrows():
-            from_sys = gate['from_system']
-            to_sys = gate['to_system']
-
-            if from_sys in known_systems and to_sys in known_systems:
-                self.graph.add_edge(from_sys, to_sys)
-                internal_edges += 1
-            else:
-                border_edges += 1
+        internal = (
+            self.gates_df['from_system'].isin(known_systems) &
+            self.gates_df['to_system'].isin(known_systems)
+        )
+        self.graph.add_edges_from(zip(
+            self.gates_df.loc[internal, 'from_system'],
+            self.gates_df.loc[internal, 'to_system'],
+        ))
+        internal_edges = int(internal.sum())
+        border_edges = len(internal) - internal_edges
 
         print(f"Graph built: {self.graph.number_of_nodes()} nodes, {internal_edges} internal edges")
         print(f"Skipped {border_edges} border connections to external regions")
 
+        # CSR adjacency in graph node order, for scipy's C graph routines
+        self._csr = nx.to_scipy_sparse_array(self.graph, format='csr')
+        self._apsp = None
+
+        # Edge endpoints as node rows, so traces and crossing counts gather coordinates by index
+        self._node_idx = {node: i for i, node in enumerate(self.graph.nodes())}
+        self._edges = np.array(
+            [(self._node_idx[a], self._node_idx[b]) for a, b in self.graph.edges()],
+            dtype=np.intp,
+        ).reshape(-1, 2)
+        self._pos_arr = None
+        self._edge_xy = None
+
         # Validate connectivity
-        if nx.is_connected(self.graph):
-            print("✓ Graph is fully connected")
-        else:
-            print("WARNING: Graph is not fully connected!")
+        if verify:
+            from scipy.sparse.csgraph import connected_components
+            n_components, labels = connected_components(self._csr, directed=False)
+            if n_components == 1:
+                print("✓ Graph is fully connected")
+            else:
+                print("WARNING: Graph is not fully connected!")
+                sizes = np.sort(np.bincount(labels))[::-1]
+                print(f"  {n_components} components, sizes: {sizes.tolist()}")
+
+        # Route tables are filled per source system on first query
+        self._dist = {}
+        self._pred = {}
 
         return self.graph
 
-    def calculate_layout(self, scale: float = 60, positions_file: Optional[str] = None) -> Dict[str, Tuple[float, float]]:
+    def _compute_shortest_paths(self, source: int) -> None:
+        """
+        Compute the jump distance and BFS predecessor rows of one system
+
+        Each row is computed by a single BFS over the CSR adjacency (in scipy's
+        C code) the first time a route or distance from that system is asked
+        for, and reused by every later query from it.
+
+        Args:
+            source: Node row of the source system
+        """
+        from scipy.sparse.csgraph import shortest_path
+
+        dist, pred = shortest_path(
+            self._csr, method='D', directed=False, unweighted=True,
+            indices=source, return_predecessors=True,
+        )
+        reachable = np.isfinite(dist)
+        self._dist[source] = np.where(reachable, dist, -1).astype(np.int16)
+        self._pred[source] = np.where(pred >= 0, pred, -1).astype(np.int32)
+
+    def _path_indices(self, system_a: str, system_b: str) -> Tuple[int, int, bool]:
+        """
+        Look up the node rows of two systems, raising NodeNotFound like NetworkX
+
+        Jumps are symmetric, so when only system_b's row has been searched it
+        answers the query instead of running a new BFS from system_a.
+
+        Returns:
+            Tuple of (searched source row, target row, whether the two
+            systems were swapped to reuse system_b's row)
+        """
+        try:
+            a, b = self._node_idx[system_a], self._node_idx[system_b]
+        except KeyError:
+            raise nx.NodeNotFound(f"Either source {system_a} or target {system_b} is not in G")
+        if a in self._dist:
+            return a, b, False
+        if b in self._dist:
+            return b, a, True
+        self._compute_shortest_paths(a)
+        return a, b, False
+
+    def calculate_layout(
+        self,
+        scale: float = 60,
+        positions_file: Optional[str] = None,
+        method: str = 'kamada_kawai',
+        verify: bool = False,
+        initial_pos: Optional[Dict[str, Tuple[float, float]]] = None
+    ) -> Dict[str, Tuple[float, float]]:
         """
         Calculate 2D layout using Kamada-Kawai algorithm
 
         Kamada-Kawai optimizes for graph-theoretic distances, meaning systems
         that are N jumps apart will appear approximately N visual units apart.
+        Stress majorization optimizes the same goal with cheap per-iteration
+        updates and is the better choice for graphs with thousands of systems.
 
         Args:
             scale: Scale factor for layout (default 60 for compact view, range 40-100)
                    Lower values = more compact, higher = more spread out
-            positions_file: Optional JSON file to load saved manual positions
+            positions_file: Optional JSON (or .npz) file to load saved manual positions
+            method: Layout algorithm, 'kamada_kawai' (default) or 'stress'
+            verify: Count and print edge crossings of a newly calculated layout
+                    (O(E^2), useful when tuning layouts)
+            initial_pos: Optional starting positions for every system, e.g.
+                         nx.spectral_layout(viz.graph); defaults to a Pivot-MDS seed
 
         Returns:
             Dictionary mapping system names to (x, y) positions
         """
+        if method not in LAYOUT_METHODS:
+            raise ValueError(f"Unknown layout method: {method}. Use 'kamada_kawai' or 'stress'")
+        if initial_pos is not None:
+            missing = [node for node in self.graph.nodes() if node not in initial_pos]
+            if missing:
+                raise ValueError(f"initial_pos is missing {len(missing)} systems, e.g. {missing[0]}")
+
         # Try to load saved positions first
         if positions_file and Path(positions_file).exists():
             print(f"Loading saved positions from {positions_file}...")
-            with open(positions_file, 'r') as f:
-                saved_data = json.load(f)
+            if Path(positions_file).suffix == '.npz':
+                self.pos = _read_positions_npz(positions_file)
+            else:
+                saved_data = _read_json(positions_file)
                 self.pos = {node: tuple(pos) for node, pos in saved_data.items()}
             print(f"✓ Loaded {len(self.pos)} saved positions")
             return self.pos
 
-        # Generate new layout with Kamada-Kawai
-        print(f"Calculating layout using Kamada-Kawai (scale={scale})...")
-        pos = nx.kamada_kawai_layout(self.graph, scale=scale)
-        self.pos = {node: (x, y) for node, (x, y) in pos.items()}
+        # Reuse a layout of this exact graph already calculated or loaded in this process
+        key = self._layout_key(scale, method, initial_pos)
+        if key in _LAYOUT_MEMO:
+            self.pos = dict(_LAYOUT_MEMO[key])
+            print(f"✓ Reused layout for {len(self.pos)} systems")
+            return self.pos
+
+        # Reuse a cached layout if this exact graph has been laid out this way before
+        cache_file = self._layout_cache_file(key)
+        if cache_file is not None and cache_file.exists():
+            print(f"Loading cached layout from {cache_file}...")
+            self.pos = _read_positions_npz(cache_file)
+            _LAYOUT_MEMO[key] = dict(self.pos)
+            print(f"✓ Loaded {len(self.pos)} cached positions")
+            return self.pos
+
+        # Generate new layout, seeded with Pivot-MDS unless given a start, so the
+        # solver starts close to its optimum
+        print(f"Calculating layout using {LAYOUT_METHODS[method]} (scale={scale})...")
+        if initial_pos is None:
+            initial_pos = self._pivot_mds()
+        if method == 'stress':
+            self.pos = self._stress_majorization(initial_pos, scale=scale)
+        else:
+            self.pos = self._kamada_kawai(initial_pos, scale=scale)
+
+        _LAYOUT_MEMO[key] = dict(self.pos)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_positions_npz(self.pos, cache_file)
 
         print(f"✓ Layout calculated for {len(self.pos)} systems")
-        crossings = self._count_edge_crossings()
-        print(f"  Edge crossings: {crossings}")
+        if verify:
+            crossings = self._count_edge_crossings()
+            print(f"  Edge crossings: {crossings}")
 
         return self.pos
 
+    def _index_positions(self) -> None:
+        """Materialize self.pos as node and edge coordinate arrays in graph order"""
+        pos = np.array([self.pos[node] for node in self.graph.nodes()], dtype=np.float64)
+        self._pos_arr = pos.astype(np.float32)
+        self._edge_xy = np.hstack([pos[self._edges[:, 0]], pos[self._edges[:, 1]]])
+
+    def _pivot_mds(self, k: int = 20) -> Dict[str, Tuple[float, float]]:
+        """
+        Approximate a 2D stress layout with Pivot-MDS
+
+        Picks k pivot systems by farthest-point sampling, runs one BFS per pivot
+        to get an N x k jump-distance matrix, double-centers it and projects onto
+        its top two singular directions. Costs O(k * (N + E)) instead of the
+        all-pairs work Kamada-Kawai does, and makes a good starting point for it.
+
+        Args:
+            k: Number of pivots (capped at the number of systems)
+
+        Returns:
+            Dictionary mapping system names to (x, y) positions
+        """
+        nodes = list(self.graph.nodes())
+        if len(nodes) < 2:
+            return {node: (0.0, 0.0) for node in nodes}
+        node_index = {node: i for i, node in enumerate(nodes)}
+        k = min(k, len(nodes))
+
+        dist = np.full((len(nodes), k), np.inf)
+        nearest_pivot = np.full(len(nodes), np.inf)
+        pivot = 0
+        for col in range(k):
+            for node, hops in nx.single_source_shortest_path_length(self.graph, nodes[pivot]).items():
+                dist[node_index[node], col] = hops
+            nearest_pivot = np.minimum(nearest_pivot, dist[:, col])
+            pivot = int(np.argmax(nearest_pivot))
+
+        # Systems unreachable from a pivot are placed just beyond its farthest system
+        finite = np.isfinite(dist)
+        dist[~finite] = dist[finite].max() + 1 if finite.any() else 1
+
+        sq = dist ** 2
+        centered = -0.5 * (sq - sq.mean(axis=0) - sq.mean(axis=1, keepdims=True) + sq.mean())
+        _, vectors = np.linalg.eigh(centered.T @ centered)
+        xy = centered @ vectors[:, -2:]
+
+        # Structurally equivalent systems (e.g. dead ends off the same hub) land on
+        # the same point, which stalls Kamada-Kawai; nudge them apart deterministically
+        xy += np.random.default_rng(0).uniform(-0.1, 0.1, xy.shape)
+
+        return {node: (x, y) for node, (x, y) in zip(nodes, xy)}
+
+    def _shortest_path_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Compute the all-pairs jump distance matrix
+
+        Runs scipy's C breadth-first search over a CSR adjacency matrix rather
+        than NetworkX's Python BFS. The matrix is computed once per graph and
+        shared by every later layout, so it is returned read-only.
+
+        Returns:
+            Tuple of (node list, N x N float distance matrix in that node order,
+            with inf for unreachable pairs)
+        """
+        from scipy.sparse.csgraph import shortest_path
+
+        if self._apsp is None:
+            self._apsp = shortest_path(self._csr, method='D', directed=False, unweighted=True)
+            self._apsp.flags.writeable = False
+
+        return list(self.graph.nodes()), self._apsp
+
+    def _kamada_kawai(
+        self,
+        initial_pos: Dict[str, Tuple[float, float]],
+        scale: float = 1
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Lay out the graph by minimizing the Kamada-Kawai energy
+
+        Same cost function as nx.kamada_kawai_layout (squared relative error
+        between drawn and jump distance, plus a weak pull of the centroid to the
+        origin), but the gradient is computed from N x N matrices with one matrix
+        product instead of N x N x 2 einsum tensors, and jump distances come
+        from BFS rather than Dijkstra.
+
+        Args:
+            initial_pos: Starting positions (e.g. from _pivot_mds)
+            scale: Half-width of the box the result is rescaled into
+
+        Returns:
+            Dictionary mapping system names to (x, y) positions
+        """
+        from scipy.optimize import minimize
+        from scipy.spatial.distance import cdist
+
+        nodes, dist = self._shortest_path_matrix()
+        n = len(nodes)
+        if n < 2:
+            return {node: (0.0, 0.0) for node in nodes}
+
+        # Unreachable pairs get a huge preferred distance, as in NetworkX
+        dist = np.where(np.isfinite(dist), dist, 1e6)
+        inv_dist = 1 / (dist + np.eye(n) * 1e-3)
+        mean_weight = 1e-3
+
+        def energy(flat):
+            xy = flat.reshape(n, 2)
+            separation = cdist(xy, xy)
+            offset = separation * inv_dist - 1.0
+            np.fill_diagonal(offset, 0)
+
+            # d/dp_i of 0.5 * sum(offset^2) over both (i, j) and (j, i)
+            coeff = 2 * inv_dist * offset / (separation + np.eye(n) * 1e-3)
+            grad = xy * coeff.sum(axis=1)[:, None] - coeff @ xy
+
+            centroid = xy.sum(axis=0)
+            cost = 0.5 * np.sum(offset ** 2) + 0.5 * mean_weight * np.sum(centroid ** 2)
+            grad += mean_weight * centroid
+            return cost, grad.ravel()
+
+        xy = np.array([initial_pos[node] for node in nodes], dtype=float)
+        result = minimize(energy, xy.ravel(), method='L-BFGS-B', jac=True)
+
+        xy = nx.rescale_layout(result.x.reshape(n, 2), scale=scale)
+        return dict(zip(nodes, map(tuple, xy.tolist())))
+
+    def _stress_majorization(
+        self,
+        initial_pos: Dict[str, Tuple[float, float]],
+        scale: float = 1,
+        max_iter: int = 300,
+        tol: float = 1e-4
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Lay out the graph by stress majorization
+
+        Minimizes sum(w_ij * (|p_i - p_j| - d_ij)^2) with w_ij = d_ij^-2, the same
+        objective as Kamada-Kawai. Each iteration moves every system to the
+        weighted average of where its neighbors' target distances put it, which
+        needs only a few dense matrix products instead of a line search.
+
+        Args:
+            initial_pos: Starting positions (e.g. from _pivot_mds)
+            scale: Half-width of the box the result is rescaled into
+            max_iter: Maximum number of iterations
+            tol: Stop once stress improves by less than this fraction
+
+        Returns:
+            Dictionary mapping system names to (x, y) positions
+        """
+        from scipy.spatial.distance import cdist
+
+        nodes, dist = self._shortest_path_matrix()
+        xy = np.array([initial_pos[node] for node in nodes], dtype=float)
+
+        # Unreachable pairs and the diagonal carry no weight
+        reachable = np.isfinite(dist) & (dist > 0)
+        weights = np.zeros_like(dist)
+        weights[reachable] = dist[reachable] ** -2.0
+        target = np.where(reachable, dist, 0.0)
+        weight_sums = weights.sum(axis=1)[:, None]
+        weight_sums[weight_sums == 0] = 1
+
+        stress = np.inf
+        for _ in range(max_iter):
+            current = cdist(xy, xy)
+            new_stress = (weights * (current - target) ** 2).sum() / 2
+            if stress - new_stress < tol * new_stress:
+                break
+            stress = new_stress
+
+            current[current == 0] = 1e-9
+            pull = weights * target / current
+            xy = (weights @ xy + xy * pull.sum(axis=1)[:, None] - pull @ xy) / weight_sums
+
+        xy = nx.rescale_layout(xy, scale=scale)
+        return dict(zip(nodes, map(tuple, xy.tolist())))
+
+    def _layout_key(
+        self,
+        scale: float,
+        method: str = 'kamada_kawai',
+        initial_pos: Optional[Dict[str, Tuple[float, float]]] = None
+    ) -> str:
+        """
+        Identify the current graph's layout at the given scale
+
+        The key is a hash of the layout method and starting positions, the node
+        order, the edge list and the scale, so any change to the graph produces
+        a new key instead of silently reusing stale positions.
+
+        Args:
+            scale: Layout scale factor
+            method: Layout algorithm name
+            initial_pos: Starting positions, or None for the Pivot-MDS seed
+
+        Returns:
+            Hex digest identifying the layout
+        """
+        nodes = list(self.graph.nodes())
+        seed = 'pivot_mds'
+        if initial_pos is not None:
+            start = np.array([initial_pos[node] for node in nodes], dtype=float)
+            seed = hashlib.blake2b(start.tobytes(), digest_size=8).hexdigest()
+
+        edges = sorted(tuple(sorted(edge)) for edge in self.graph.edges())
+        key = repr((f'{method}/{seed}', nodes, edges, float(scale)))
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    def _layout_cache_file(self, key: str) -> Optional[Path]:
+        """
+        Get the cache file for a layout key
+
+        Args:
+            key: Layout key from _layout_key
+
+        Returns:
+            Path to the .npz cache file, or None if caching is disabled
+        """
+        if self.layout_cache_dir is None:
+            return None
+        return self.layout_cache_dir / f"{key}.npz"
+
     def save_positions(self, filename: str = "positions_manual.json") -> None:
         """
         Save current node positions to JSON file for manual editing/reloading
 
         Positions are rounded to nearest integers for easier manual editing.
+        A filename ending in .npz saves a compact binary file instead, with
+        unrounded float32 positions (not hand-editable, but fast to load).
 
         Args:
             filename: Output filename
         """
+        if Path(filename).suffix == '.npz':
+            _write_positions_npz(self.pos, filename, dtype=np.float32)
+            print(f"✓ Saved positions to {filename}")
+            print(f"  Reload with calculate_layout(positions_file='{filename}')")
+            return
+
         # Round positions to integers for easier editing
         rounded_positions = {node: [round(x), round(y)] for node, (x, y) in self.pos.items()}
 
-        with open(filename, 'w') as f:
-            json.dump(rounded_positions, f, indent=2)
+        _write_json(rounded_positions, filename)
         print(f"✓ Saved positions to {filename}")
         print(f"  Positions rounded to integers for easier editing")
         print(f"  You can manually edit this file and reload with calculate_layout(positions_file='{filename}')")
 
     def _count_edge_crossings(self) -> int:
         """Count the number of edge crossings in the current layout"""
-        edges = list(self.graph.edges())
-        crossings = 0
+        if len(self._edges) < 2:
+            return 0
+        if self._edge_xy is None:
+            self._index_positions()
+
+        # Full-precision endpoints; node rows let edges sharing a system be masked out
+        start, end = self._edge_xy[:, :2], self._edge_xy[:, 2:]
+
+        # Candidate pairs (i, j): every pair for small graphs, sweep-pruned for large ones
+        if len(self._edges) > SWEEP_EDGE_THRESHOLD:
+            i, j = self._sweep_candidate_pairs(start, end)
+        else:
+            i, j = np.triu_indices(len(self._edges), k=1)
+
+        a, b = self._edges[:, 0], self._edges[:, 1]
+        disjoint = (a[i] != a[j]) & (a[i] != b[j]) & (b[i] != a[j]) & (b[i] != b[j])
+        i, j = i[disjoint], j[disjoint]
 
-        for i, (a, b) in enumerate(edges):
-            for c, d in edges[i+1:]:
-                if a == c or a == d or b == c or b == d:
-                    continue
+        p1, p2, p3, p4 = start[i].T, end[i].T, start[j].T, end[j].T
+        return int(np.count_nonzero(self._segments_intersect(p1, p2, p3, p4)))
 
-                if self._segments_intersect(
-                    self.pos[a], self.pos[b],
-                    self.pos[c], self.pos[d]
-                ):
-                    crossings += 1
+    @staticmethod
+    def _sweep_candidate_pairs(start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sweep edges left to right and pair each edge only with the edges whose
+        x-extent overlaps it, then drop pairs whose y-extents are disjoint
+
+        Segments with disjoint bounding boxes can never intersect, so the
+        result is exact while skipping most of the E^2 pairs on large maps.
 
-        return crossings
+        Args:
+            start: (E, 2) array of edge start points
+            end: (E, 2) array of edge end points
 
-    def _segments_intersect(self, p1, p2, p3, p4) -> bool:
-        """Check if line segments (p1,p2) and (p3,p4) intersect"""
-        def ccw(A, B, C):
-            return (C[1]-A[1]) * (B[0]-A[0]) > (B[1]-A[1]) * (C[0]-A[0])
+        Returns:
+            Tuple of (i, j) edge index arrays, each unordered pair listed once
+        """
+        lo = np.minimum(start, end)
+        hi = np.maximum(start, end)
+
+        order = np.argsort(lo[:, 0], kind='stable')
+        # In sweep order, edge k overlaps edges k+1 .. stop[k]-1 on the x-axis
+        stop = np.searchsorted(lo[order, 0], hi[order, 0], side='right')
+        first = np.arange(1, len(order) + 1)
+        counts = np.maximum(stop - first, 0)
+
+        rows = np.repeat(np.arange(len(order)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cols = np.repeat(first, counts) + offsets
+
+        # Keep i < j so each pair is tested in the same orientation as the full scan
+        i = np.minimum(order[rows], order[cols])
+        j = np.maximum(order[rows], order[cols])
+        overlap_y = (lo[i, 1] <= hi[j, 1]) & (lo[j, 1] <= hi[i, 1])
+        return i[overlap_y], j[overlap_y]
+
+    @staticmethod
+    def _segments_intersect(p1, p2, p3, p4) -> Union[bool, np.ndarray]:
+        """
+        Check if line segments (p1,p2) and (p3,p4) intersect
 
-        return ccw(p1,p3,p4) != ccw(p2,p3,p4) and ccw(p1,p2,p3) != ccw(p1,p2,p4)
+        Points may be (x, y) pairs or pairs of coordinate arrays, in which
+        case the result is a boolean array.
+        """
+        d1 = _ccw(*p1, *p3, *p4)
+        d2 = _ccw(*p1, *p2, *p3)
+        d3 = _ccw(*p1, *p2, *p4)
+        d4 = _ccw(*p2, *p3, *p4)
+        return (d1 ^ d4) & (d2 ^ d3)
 
     def assign_constellation_colors(self) -> Dict[str, str]:
-        """Assign unique colors to each constellation"""
-        constellations = self.systems_df['constellation'].unique()
+        """
+        Assign unique colors to each constellation
+
+        The assignment is computed once per loaded dataset; later calls return
+        the existing mapping.
+        """
+        if self.constellation_colors:
+            return self.constellation_colors
+
+        constellations = np.sort(self.systems_df['constellation'].drop_duplicates().to_numpy())
 
-        colors = [
+        colors = np.array([
             '#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8',
             '#F7DC6F', '#BB8FCE', '#85C1E2', '#F8B739', '#52B788',
             '#E63946', '#A8DADC', '#457B9D', '#F4A261', '#E76F51',
-        ]
+        ])
 
-        self.constellation_colors = {
-            const: colors[i % len(colors)]
-            for i, const in enumerate(sorted(constellations))
-        }
+        # Cycle the palette over the sorted constellations with one modulo and gather
+        palette = colors[np.arange(len(constellations)) % len(colors)]
+        self.constellation_colors = dict(zip(constellations.tolist(), palette.tolist()))
 
         return self.constellation_colors
 
     def create_plotly_figure(
         self,
         highlight_systems: Optional[List[str]] = None,
-        show_labels: bool = True,
+        show_labels: bool = False,
         title: str = "Pure Blind Region - Kamada-Kawai Layout",
-        editable: bool = True
+        editable: bool = True,
+        lod_level: int = 0
     ) -> go.Figure:
         """
         Create interactive Plotly visualization
 
+        Nodes and edges are drawn with WebGL (Scattergl) traces so panning and
+        zooming stay responsive on large maps.
+
         Args:
             highlight_systems: Optional list of systems to highlight
-            show_labels: Whether to show system labels
+            show_labels: Whether to draw system names next to nodes (names are always in the hover text)
             title: Title for the graph
             editable: Enable draggable nodes for manual positioning
+            lod_level: Edge level of detail; 0 draws every gate, higher levels keep
+                       only the most central fraction (see EDGE_LOD_FRACTIONS)
 
         Returns:
             Plotly Figure object
@@ -234,7 +944,7 @@ class GraphVisualizer:
         print("Creating interactive Plotly visualization...")
 
         # Create edge traces
-        edge_traces = self._create_edge_traces()
+        edge_traces = self._create_edge_traces(lod_level)
 
         # Create node traces
         node_traces = self._create_node_traces(highlight_systems, show_labels)
@@ -305,18 +1015,49 @@ class GraphVisualizer:
         print("✓ Plotly figure created")
         return fig
 
-    def _create_edge_traces(self) -> List[go.Scatter]:
-        """Create traces for gate connections"""
-        edge_x = []
-        edge_y = []
+    def _build_lod(self) -> np.ndarray:
+        """
+        Rank edges for level-of-detail rendering
+
+        Edges are ordered by the summed PageRank of their endpoints, so coarse
+        levels keep the gates between the best-connected systems. The ranking is
+        computed once per graph.
+
+        Returns:
+            (E, 2) node rows of all edges, most important first
+        """
+        if self._edges_by_rank is None:
+            rank = nx.pagerank(self.graph)
+            rank = np.array([rank[node] for node in self.graph.nodes()])
+            score = rank[self._edges[:, 0]] + rank[self._edges[:, 1]]
+            self._edges_by_rank = self._edges[np.argsort(-score, kind='stable')]
+        return self._edges_by_rank
+
+    def _create_edge_traces(self, lod_level: int = 0) -> List[go.Scattergl]:
+        """
+        Create traces for gate connections
+
+        Args:
+            lod_level: Index into EDGE_LOD_FRACTIONS; 0 draws every edge
+        """
+        if not 0 <= lod_level < len(EDGE_LOD_FRACTIONS):
+            raise ValueError(f"Unknown edge level of detail: {lod_level}. Use 0-{len(EDGE_LOD_FRACTIONS) - 1}")
+        if self._pos_arr is None:
+            self._index_positions()
+
+        if lod_level == 0:
+            edges = self._edges
+        else:
+            ranked = self._build_lod()
+            edges = ranked[:int(np.ceil(EDGE_LOD_FRACTIONS[lod_level] * len(ranked)))]
 
-        for edge in self.graph.edges():
-            x0, y0 = self.pos[edge[0]]
-            x1, y1 = self.pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+        # One gather of both endpoints, written straight into a (2, E, 3) x/y buffer
+        # whose third column stays NaN, so each row of it is already interleaved
+        coords = np.full((2, len(edges), 3), np.nan, dtype=np.float32)
+        coords[:, :, :2] = self._pos_arr[edges].transpose(2, 0, 1)
+        edge_x, edge_y = coords.reshape(2, -1)
 
-        edge_trace = go.Scatter(
+        edge_trace = go.Scattergl(
             x=edge_x,
             y=edge_y,
             line=dict(width=1, color='#555555'),
@@ -331,68 +1072,73 @@ class GraphVisualizer:
     def _create_node_traces(
         self,
         highlight_systems: Optional[List[str]] = None,
-        show_labels: bool = True
-    ) -> List[go.Scatter]:
-        """Create traces for system nodes, grouped by constellation"""
-        traces = []
-
-        for constellation, color in self.constellation_colors.items():
-            systems_in_const = [
-                node for node in self.graph.nodes()
-                if self.graph.nodes[node]['constellation'] == constellation
-            ]
-
-            if not systems_in_const:
-                continue
-
-            node_x = [self.pos[node][0] for node in systems_in_const]
-            node_y = [self.pos[node][1] for node in systems_in_const]
-            node_text = systems_in_const if show_labels else ['' for _ in systems_in_const]
-
-            # Hover info
-            hover_text = []
-            for node in systems_in_const:
-                attrs = self.graph.nodes[node]
-                hover_info = (
-                    f"<b>{node}</b><br>"
-                    f"Constellation: {attrs['constellation']}<br>"
-                    f"Security: {attrs['security']:.2f}<br>"
-                    f"Moons: {attrs['moons']}<br>"
-                    f"Ice: {'Yes' if attrs['has_ice'] else 'No'}<br>"
-                    f"Power: {attrs['power_capacity']}<br>"
-                    f"Workforce: {attrs['workforce_capacity']}"
-                )
-                hover_text.append(hover_info)
-
-            # Marker size
-            marker_size = 12
-            if highlight_systems:
-                marker_size = [
-                    16 if node in highlight_systems else 12
-                    for node in systems_in_const
-                ]
-
-            trace = go.Scatter(
-                x=node_x,
-                y=node_y,
-                mode='markers+text' if show_labels else 'markers',
-                text=node_text,
-                textposition="top center",
-                textfont=dict(size=9, color='white'),
-                hovertext=hover_text,
-                hoverinfo='text',
-                marker=dict(
-                    size=marker_size,
-                    color=color,
-                    line=dict(width=1.5, color='white')
-                ),
+        show_labels: bool = False
+    ) -> List[go.Scattergl]:
+        """
+        Create one trace for all system nodes, colored by constellation
+
+        All systems share a single WebGL trace with per-point colors, so the map
+        is one draw call no matter how many constellations there are. The legend
+        is built from empty per-constellation traces that carry no data.
+        """
+        if self._pos_arr is None:
+            self._index_positions()
+
+        # Per-system colors gathered from the palette by constellation code
+        colors = np.array(list(self.constellation_colors.values()))
+        # Rows grouped by constellation in legend order; systems whose
+        # constellation has no color are left out
+        codes = pd.Categorical(self._constellation, categories=list(self.constellation_colors)).codes
+        rows = np.argsort(codes, kind='stable')
+        rows = rows[codes[rows] >= 0]
+        nodes = self._names[rows]
+        node_colors = colors[codes[rows]]
+
+        # float32 arrays go to the browser as compact typed arrays rather than JSON numbers
+        node_x = self._pos_arr[rows, 0]
+        node_y = self._pos_arr[rows, 1]
+        # Without labels, leave text out of the figure entirely
+        node_text = nodes if show_labels else None
+
+        hover_text = self._hover[rows]
+
+        # Marker size
+        marker_size = 12
+        if highlight_systems:
+            marker_size = np.where(np.isin(nodes, list(highlight_systems)), 16, 12)
+
+        node_trace = go.Scattergl(
+            x=node_x,
+            y=node_y,
+            mode='markers+text' if show_labels else 'markers',
+            text=node_text,
+            textposition="top center",
+            textfont=dict(size=9, color='white'),
+            hovertext=hover_text,
+            hoverinfo='text',
+            marker=dict(
+                size=marker_size,
+                color=node_colors,
+                line=dict(width=1.5, color='white')
+            ),
+            name='Systems',
+            showlegend=False,
+        )
+
+        # Legend entries only: one empty trace per constellation
+        legend_traces = [
+            go.Scattergl(
+                x=[None],
+                y=[None],
+                mode='markers',
+                marker=dict(size=12, color=color, line=dict(width=1.5, color='white')),
                 name=constellation,
                 legendgroup=constellation,
             )
+            for constellation, color in self.constellation_colors.items()
+        ]
 
-            traces.append(trace)
-
-        return traces
+        return [node_trace] + legend_traces
 
     def export_html(self, filename: str = "pure_blind_map.html", editable: bool = True) -> None:
         """
@@ -404,24 +1150,20 @@ class GraphVisualizer:
         """
         fig = self.create_plotly_figure(editable=editable)
 
-        # Get the figure as JSON
-        import json as json_module
-        fig_json = fig.to_json()
-
         # Custom HTML with grid toggle button
         html_template = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8" />
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <script src="https://cdn.plot.ly/plotly-{plotly_version}.min.js"></script>
     <style>
-        body {{
+        body {
             margin: 0;
             padding: 0;
             background-color: #1a1a1a;
             font-family: Arial, sans-serif;
-        }}
-        #controls {{
+        }
+        #controls {
             position: fixed;
             top: 10px;
             right: 10px;
@@ -430,8 +1172,8 @@ class GraphVisualizer:
             padding: 10px 15px;
             border-radius: 5px;
             border: 1px solid rgba(255, 255, 255, 0.3);
-        }}
-        #gridToggle {{
+        }
+        #gridToggle {
             background-color: #4CAF50;
             color: white;
             border: none;
@@ -440,20 +1182,20 @@ class GraphVisualizer:
             border-radius: 4px;
             font-size: 14px;
             font-weight: bold;
-        }}
-        #gridToggle:hover {{
+        }
+        #gridToggle:hover {
             background-color: #45a049;
-        }}
-        #gridToggle.off {{
+        }
+        #gridToggle.off {
             background-color: #f44336;
-        }}
-        #gridToggle.off:hover {{
+        }
+        #gridToggle.off:hover {
             background-color: #da190b;
-        }}
-        #plotDiv {{
+        }
+        #plotDiv {
             width: 100%;
             height: 100vh;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -469,38 +1211,48 @@ class GraphVisualizer:
         var figureData = {fig_json};
 
         // Plot the figure
-        Plotly.newPlot(plotDiv, figureData.data, figureData.layout, {{responsive: true}});
+        Plotly.newPlot(plotDiv, figureData.data, figureData.layout, {responsive: true});
 
         // Grid toggle functionality
-        document.getElementById('gridToggle').addEventListener('click', function() {{
+        document.getElementById('gridToggle').addEventListener('click', function() {
             gridOn = !gridOn;
             var button = this;
 
-            var update = {{
+            var update = {
                 'xaxis.showgrid': gridOn,
                 'xaxis.showticklabels': gridOn,
                 'yaxis.showgrid': gridOn,
                 'yaxis.showticklabels': gridOn
-            }};
+            };
 
             Plotly.relayout(plotDiv, update);
 
-            if (gridOn) {{
+            if (gridOn) {
                 button.textContent = 'Grid: ON';
                 button.className = 'on';
-            }} else {{
+            } else {
                 button.textContent = 'Grid: OFF';
                 button.className = 'off';
-            }}
-        }});
+            }
+        });
     </script>
 </body>
 </html>
 """
+        # The figure JSON is written between the two halves of the template
+        # rather than format()-ed into it, which avoids the second format() copy
+        # of the multi-MB JSON string
+        html_head, html_tail = html_template.split('{fig_json}')
+
+        # Coordinate arrays are encoded as typed arrays in the figure JSON, so
+        # the page must load the plotly.js version this plotly.py targets
+        html_head = html_head.replace('{plotly_version}', get_plotlyjs_version())
 
         # Write custom HTML
         with open(filename, 'w') as f:
-            f.write(html_template.format(fig_json=fig_json))
+            f.write(html_head)
+            pio.write_json(fig, f, validate=False)
+            f.write(html_tail)
 
         print(f"✓ Exported to {filename}")
         print(f"  Grid toggle button added (top-right corner)")
@@ -510,6 +1262,33 @@ class GraphVisualizer:
             print(f"  For full manual positioning, use save_positions() to export,")
             print(f"  then manually edit the JSON file and reload.")
 
+    def to_json(
+        self,
+        highlight_systems: Optional[List[str]] = None,
+        show_labels: bool = False,
+        title: str = "Pure Blind Region - Kamada-Kawai Layout",
+        editable: bool = True,
+        lod_level: int = 0
+    ) -> str:
+        """
+        Serialize the visualization as Plotly figure JSON
+
+        The figure is built from validated graph objects already, so the second
+        schema walk plotly does while serializing is skipped.
+
+        Args:
+            highlight_systems: Optional list of systems to highlight
+            show_labels: Whether to draw system names next to nodes
+            title: Title for the graph
+            editable: Enable draggable nodes for manual positioning
+            lod_level: Edge level of detail (see create_plotly_figure)
+
+        Returns:
+            Compact figure JSON, ready for Plotly.newPlot or a Dash graph
+        """
+        fig = self.create_plotly_figure(highlight_systems, show_labels, title, editable, lod_level)
+        return pio.to_json(fig, validate=False, pretty=False)
+
     # Utility methods
     def get_system_info(self, system_name: str) -> Dict:
         """Get detailed information about a system"""
@@ -525,25 +1304,27 @@ class GraphVisualizer:
 
     def get_constellation_systems(self, constellation: str) -> List[str]:
         """Get all systems in a constellation"""
-        return [
-            node for node in self.graph.nodes()
-            if self.graph.nodes[node]['constellation'] == constellation
-        ]
+        return list(self._nodes_by_constellation.get(constellation, []))
 
     def calculate_distance(self, system_a: str, system_b: str) -> int:
         """Calculate jump distance between two systems"""
-        try:
-            return nx.shortest_path_length(self.graph, system_a, system_b)
-        except nx.NetworkXNoPath:
-            return -1
+        a, b, _ = self._path_indices(system_a, system_b)
+        return int(self._dist[a][b])
 
     def get_route(self, system_a: str, system_b: str) -> List[str]:
         """Get shortest route between two systems"""
-        try:
-            return nx.shortest_path(self.graph, system_a, system_b)
-        except nx.NetworkXNoPath:
+        a, b, swapped = self._path_indices(system_a, system_b)
+        if self._dist[a][b] < 0:
             return []
 
+        # Walking predecessors yields the route target-first, which is already
+        # system_a-first when the two were swapped
+        pred = self._pred[a]
+        route = [b]
+        while route[-1] != a:
+            route.append(pred[route[-1]])
+        return self._names[route if swapped else route[::-1]].tolist()
+
 
 def main():
     """
@@ -562,7 +1343,7 @@ def main():
     viz.load_data()
 
     # Build graph
-    viz.build_graph()
+    viz.build_graph(verify=True)
 
     # Assign constellation colors
     viz.assign_constellation_colors()
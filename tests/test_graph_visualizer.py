@@ -0,0 +1,114 @@
+"""
+Tests for GraphVisualizer
+
+Run with:
+    pytest tests/
+"""
+
+import sys
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from graph_visualizer import SWEEP_EDGE_THRESHOLD, GraphVisualizer
+
+
+def _visualizer() -> GraphVisualizer:
+    viz = GraphVisualizer(ROOT / "data" / "pure_blind_data", layout_cache_dir=None)
+    viz.load_data()
+    viz.build_graph()
+    viz.calculate_layout()
+    return viz
+
+
+def test_figure_keeps_coordinate_arrays():
+    viz = _visualizer()
+    system = viz.systems_df['system_name'].iloc[0]
+
+    for highlight in (None, [system], None):
+        fig = viz.create_plotly_figure(highlight_systems=highlight)
+        for trace in fig.data:
+            assert not isinstance(trace.x, dict)
+            assert not isinstance(trace.y, dict)
+            assert np.asarray(trace.x, dtype=float).shape == np.asarray(trace.y, dtype=float).shape
+
+    assert np.all(np.asarray(fig.data[1].marker.size) == 12)
+
+
+def test_routes_match_networkx():
+    viz = GraphVisualizer(ROOT / "data" / "pure_blind_data", layout_cache_dir=None)
+    viz.load_data()
+
+    # A separate two-system island and a lone system, so unreachable pairs are covered
+    islands = viz.systems_df.iloc[:3].copy()
+    islands['system_name'] = ['ISLAND-1', 'ISLAND-2', 'LONE-1']
+    viz.systems_df = pd.concat([viz.systems_df, islands], ignore_index=True)
+    viz.gates_df = pd.concat(
+        [viz.gates_df, pd.DataFrame({'from_system': ['ISLAND-1'], 'to_system': ['ISLAND-2']})],
+        ignore_index=True,
+    )
+    viz.build_graph()
+
+    expected = dict(nx.all_pairs_shortest_path_length(viz.graph))
+    for a in viz.graph.nodes():
+        for b in viz.graph.nodes():
+            distance = viz.calculate_distance(a, b)
+            route = viz.get_route(a, b)
+            if b not in expected[a]:
+                assert distance == -1
+                assert route == []
+                continue
+            assert distance == expected[a][b]
+            assert len(route) == distance + 1
+            assert route[0] == a and route[-1] == b
+            assert all(viz.graph.has_edge(u, v) for u, v in zip(route, route[1:]))
+
+    with pytest.raises(nx.NodeNotFound):
+        viz.calculate_distance('ISLAND-1', 'NOT-A-SYSTEM')
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_edge_crossings_match_pairwise_count(seed):
+    # Enough edges to take the sweep path, on a small integer grid so many
+    # segments are collinear, overlapping or touch at endpoints
+    graph = nx.gnm_random_graph(150, SWEEP_EDGE_THRESHOLD + 200, seed=seed)
+    grid = np.random.default_rng(seed).integers(0, 12, (graph.number_of_nodes(), 2))
+
+    viz = GraphVisualizer(ROOT / "data" / "pure_blind_data", layout_cache_dir=None)
+    viz.graph = graph
+    viz._edges = np.array(list(graph.edges()), dtype=np.intp)
+    viz.pos = {node: (int(x), int(y)) for node, (x, y) in zip(graph.nodes(), grid)}
+
+    edges = list(graph.edges())
+    expected = 0
+    for k, (a, b) in enumerate(edges):
+        for c, d in edges[k + 1:]:
+            if len({a, b, c, d}) < 4:
+                continue
+            if GraphVisualizer._segments_intersect(viz.pos[a], viz.pos[b], viz.pos[c], viz.pos[d]):
+                expected += 1
+
+    assert viz._count_edge_crossings() == expected
+
+
+def test_kamada_kawai_matches_networkx():
+    viz = GraphVisualizer(ROOT / "data" / "pure_blind_data", layout_cache_dir=None)
+    viz.load_data()
+    viz.build_graph()
+    initial_pos = viz._pivot_mds()
+
+    ours = viz._kamada_kawai(initial_pos, scale=60)
+    expected = nx.kamada_kawai_layout(viz.graph, pos=initial_pos, scale=60)
+
+    nodes = list(viz.graph.nodes())
+    np.testing.assert_allclose(
+        [ours[node] for node in nodes],
+        [expected[node] for node in nodes],
+        atol=1e-3,
+    )